@@ -32,8 +32,9 @@ def status(args):
     poller.register(socket, zmq.POLLIN)
     socks = dict(poller.poll(1000))
     if socket in socks and socks[socket] == zmq.POLLIN:
-        rec = socket.recv()
-        dump = json.loads(rec)
+        dump = {}
+        for rec in socket.recv_multipart():
+            dump.update(json.loads(rec))
         if args.status_parameter in dump:
             dump = dump[args.status_parameter]
         print(json.dumps(dump, sort_keys=True, indent=4))
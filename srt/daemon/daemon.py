@@ -4,16 +4,21 @@ Main Control and Orchestration Class for the Small Radio Telescope
 
 """
 
-from time import sleep, time
+from time import sleep, time, monotonic
 from datetime import timedelta, datetime
-from threading import Thread
-from queue import Queue
-from xmlrpc.client import ServerProxy
+from threading import Thread, Event
+from queue import Queue, SimpleQueue, Empty
+from xmlrpc.client import ServerProxy, MultiCall, Fault
 from pathlib import Path
-from operator import add
+from collections import deque
 
 import zmq
 import json
+import calendar
+import math
+import re
+import lzma
+import pickle
 import numpy as np
 
 from .rotor_control.rotors import Rotor
@@ -27,6 +32,10 @@ from .radio_control.radio_task_starter import (
 from .utilities.object_tracker import EphemerisTracker
 from .utilities.functions import azel_within_range, get_spectrum
 
+# Patterns for Wait-Until Commands, Matched Against the Lower-Cased Command Name
+LST_WAIT_PATTERN = re.compile(r"lst:(\d{1,2}):(\d{1,2}):(\d{1,2})")
+DATE_WAIT_PATTERN = re.compile(r"(\d{4}):(\d{1,3}):(\d{1,2}):(\d{1,2}):(\d{1,2})")
+
 
 class SmallRadioTelescopeDaemon:
     """
@@ -96,26 +105,30 @@ class SmallRadioTelescopeDaemon:
         self.cal_power = 1.0 / (self.temp_sys + self.temp_cal)
         calibration_path = Path(config_directory, "calibration.json")
         if calibration_path.is_file():
-            with open(calibration_path, "r") as input_file:
-                try:
-                    cal_data = json.load(input_file)
-                    # If Calibration is of a Different Size Than The Current FFT Size, Discard
-                    if len(cal_data["cal_values"]) == self.radio_num_bins:
-                        self.cal_values = cal_data["cal_values"]
-                        self.cal_power = cal_data["cal_pwr"]
-                except KeyError:
-                    pass
-
-        # Create Helper Object Which Tracks Celestial Objects
-        self.ephemeris_tracker = EphemerisTracker(
-            self.station["latitude"],
-            self.station["longitude"],
-            config_file=str(
-                Path(config_directory, "sky_coords.csv").absolute()),
-        )
-        self.ephemeris_locations = self.ephemeris_tracker.get_all_azimuth_elevation()
-        self.ephemeris_vlsr = self.ephemeris_tracker.get_all_vlsr()
-        self.ephemeris_time_locs = self.ephemeris_tracker.get_all_azel_time()
+            try:
+                cal_data = json.loads(calibration_path.read_bytes())
+                # If Calibration is of a Different Size Than The Current FFT Size, Discard
+                if len(cal_data["cal_values"]) == self.radio_num_bins:
+                    self.cal_values = cal_data["cal_values"]
+                    self.cal_power = cal_data["cal_pwr"]
+            except KeyError:
+                pass
+
+        # Helper Object Which Tracks Celestial Objects is Created by the Ephemeris
+        # Thread, so its Startup Cost Overlaps With Starting the Radio
+        self.ephemeris_config_file = str(
+            Path(config_directory, "sky_coords.csv").absolute())
+        self.ephemeris_tracker = None
+        self.ephemeris_ready = Event()
+        self.ephemeris_error = None
+        self.ephemeris_locations = {}
+        self.ephemeris_vlsr = {}
+        # Same Time Offset Keys as EphemerisTracker, Which the Dashboard Graphs Expect
+        self.ephemeris_time_locs = {
+            time_passed: {} for time_passed in range(0, 61, 5)}
+        self.ephemeris_version = 0
+        self.ephemeris_cache_path = Path(config_directory, "ephemeris_cache.xz")
+        self.load_ephemeris_cache()
         self.current_vlsr = 0.0
         self.ephemeris_cmd_location = None
 
@@ -129,29 +142,79 @@ class SmallRadioTelescopeDaemon:
         )
         print("test", self.stow_location)
         self.rotor_location = self.stow_location
+        self.rotor_location_event = Event()
+        # Smallest Change in Motor Az or El, in degrees, Worth Pushing to GNU Radio
+        self.motor_update_threshold = 0.01
+        self.last_sent_motor_az = None
+        self.last_sent_motor_el = None
         self.rotor_destination = self.stow_location
         self.rotor_offsets = (0.0, 0.0)
-        self.rotor_cmd_location = tuple(
-            map(add, self.rotor_destination, self.rotor_offsets)
+        self.rotor_cmd_location = (
+            self.rotor_destination[0] + self.rotor_offsets[0],
+            self.rotor_destination[1] + self.rotor_offsets[1],
         )
 
         # Create Radio Processing Task (Wrapper for GNU Radio Script)
         self.radio_process_task = RadioProcessTask(
             num_bins=self.radio_num_bins, num_integrations=self.radio_integ_cycles
         )
-        self.radio_queue = Queue()
+        self.radio_queue = SimpleQueue()
         self.radio_save_task = None
 
         # Create Object for Keeping Track of What Commands Are Running or Have Failed
         self.current_queue_item = "None"
         self.command_queue = Queue()
-        self.command_error_logs = []
+        self.command_error_logs = deque(maxlen=500)
         self.keep_running = True
 
+        # Map Each Fixed Command Name to its Handler, Which Takes the Split Command
+        self.command_handlers = {
+            "stow": lambda command_parts: self.stow(),
+            "cal": lambda command_parts: self.point_at_azel(*self.cal_location),
+            "calibrate": lambda command_parts: self.calibrate(),
+            "quit": lambda command_parts: self.quit(),
+            "record": lambda command_parts: self.start_recording(
+                name=(None if len(command_parts) <= 1 else command_parts[1])
+            ),
+            "roff": lambda command_parts: self.stop_recording(),
+            "freq": lambda command_parts: self.set_freq(
+                frequency=float(command_parts[1]) * 1e6
+            ),
+            "samp": lambda command_parts: self.set_samp_rate(
+                samp_rate=float(command_parts[1]) * 1e6
+            ),
+            "coords": lambda command_parts: self.set_coords(
+                float(command_parts[1]), float(command_parts[2])
+            ),
+            "azel": lambda command_parts: self.point_at_azel(
+                float(command_parts[1]), float(command_parts[2])
+            ),
+            "offset": lambda command_parts: self.point_at_offset(
+                float(command_parts[1]), float(command_parts[2])
+            ),
+            "wait": lambda command_parts: sleep(float(command_parts[1])),
+        }
+
         # List for data that will be plotted in the app
         self.n_point_data = []
         self.beam_switch_data = []
 
+        # Serialize the Status Values That Never Change Once, Rather Than Every Publish
+        self.static_status_bytes = json.dumps(
+            {
+                "beam_width": self.beamwidth,
+                "az_limits": self.az_limits,
+                "el_limits": self.el_limits,
+                "stow_loc": self.stow_location,
+                "cal_loc": self.cal_location,
+                "horizon_points": self.horizon_points,
+                "emergency_contact": self.contact,
+                "temp_cal": self.temp_cal,
+                "temp_sys": self.temp_sys,
+            },
+            separators=(",", ":"),
+        ).encode()
+
     def log_message(self, message):
         """Writes Contents to a Logging List and Prints
 
@@ -167,6 +230,78 @@ class SmallRadioTelescopeDaemon:
         self.command_error_logs.append((time(), message))
         print(message)
 
+    def load_ephemeris_cache(self, max_age=600):
+        """Loads Object Locations Saved by a Previous Run, if Recent and for This Station
+
+        This lets the status show object locations before the ephemeris tracker has
+        finished starting up, after which the tracker replaces them with fresh values
+
+        Parameters
+        ----------
+        max_age : float
+            Maximum Age, in seconds, of a Cache Worth Using
+
+        Returns
+        -------
+        None
+        """
+        if not self.ephemeris_cache_path.is_file():
+            return
+        try:
+            with lzma.open(self.ephemeris_cache_path, "rb") as input_file:
+                cache = pickle.load(input_file)
+            if (
+                time() - cache["time"] < max_age
+                and cache["latitude"] == self.station["latitude"]
+                and cache["longitude"] == self.station["longitude"]
+            ):
+                self.ephemeris_locations = cache["locations"]
+                self.ephemeris_vlsr = cache["vlsr"]
+                self.ephemeris_time_locs = cache["time_locations"]
+        except (OSError, EOFError, KeyError, lzma.LZMAError, pickle.UnpicklingError):
+            pass
+
+    def save_ephemeris_cache(self):
+        """Saves the Current Object Locations for the Next Run to Start From
+
+        Returns
+        -------
+        None
+        """
+        cache = {
+            "time": time(),
+            "latitude": self.station["latitude"],
+            "longitude": self.station["longitude"],
+            "locations": self.ephemeris_locations,
+            "vlsr": self.ephemeris_vlsr,
+            "time_locations": self.ephemeris_time_locs,
+        }
+        try:
+            with lzma.open(self.ephemeris_cache_path, "wb") as output_file:
+                pickle.dump(cache, output_file)
+        except OSError as e:
+            self.log_message(str(e))
+
+    def wait_for_rotor(self, timeout=1.0):
+        """Blocks Until the Rotor Reports Being at the Commanded Location
+
+        Wakes whenever the rotor thread fetches a new position rather than polling
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum Time, in seconds, to Wait Between Position Checks
+
+        Returns
+        -------
+        None
+        """
+        while True:
+            self.rotor_location_event.clear()
+            if azel_within_range(self.rotor_location, self.rotor_cmd_location):
+                return
+            self.rotor_location_event.wait(timeout=timeout)
+
     def n_point_scan(self, object_id):
         """Runs an N-Point (25) Scan About an Object
 
@@ -191,18 +326,21 @@ class SmallRadioTelescopeDaemon:
         #
         scan_center = self.ephemeris_locations[object_id]
         np_sides = [5, 5]
+        # Precompute the Full 5x5 Grid of Offsets About the Scan Center
+        grid_difs = np.arange(-2, 3) * self.beamwidth * 0.5
+        az_dif_scalars = np.cos(np.deg2rad(scan_center[1] + grid_difs))
+        # Avoid issues where you get close to the zenith
+        near_zenith = np.abs(az_dif_scalars) < 1e-4
+        az_difs = np.where(
+            near_zenith[:, None],
+            0.0,
+            grid_difs[None, :] / np.where(near_zenith, 1.0, az_dif_scalars)[:, None],
+        )
         for scan in range(N_pnt_default):
             self.log_message(
                 "{0} of {1} point scan.".format(scan, N_pnt_default))
-            i = (scan // 5) - 2
-            j = (scan % 5) - 2
-            el_dif = i * self.beamwidth * 0.5
-            az_dif_scalar = np.cos((scan_center[1] + el_dif) * np.pi / 180.0)
-            # Avoid issues where you get close to the zenith
-            if np.abs(az_dif_scalar) < 1e-4:
-                az_dif = 0
-            else:
-                az_dif = j * self.beamwidth * 0.5 / az_dif_scalar
+            el_dif = float(grid_difs[scan // 5])
+            az_dif = float(az_difs[scan // 5, scan % 5])
 
             new_rotor_offsets = (az_dif, el_dif)
 
@@ -245,9 +383,9 @@ class SmallRadioTelescopeDaemon:
         new_rotor_destination = self.ephemeris_locations[object_id]
         rotor_loc = []
         pwr_list = []
+        az_dif_scalar = math.cos(math.radians(new_rotor_destination[1]))
         for j in range(0, 3 * self.num_beamswitches):
             self.radio_queue.put(("beam_switch", j + 1))
-            az_dif_scalar = np.cos(new_rotor_destination[1] * np.pi / 180.0)
             az_dif = (j % 3 - 1) * self.beamwidth / az_dif_scalar
             new_rotor_offsets = (az_dif, 0)
             if self.rotor.angles_within_bounds(*new_rotor_destination):
@@ -288,8 +426,7 @@ class SmallRadioTelescopeDaemon:
             self.ephemeris_cmd_location = object_id
             self.rotor_destination = new_rotor_cmd_location
             self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.wait_for_rotor()
         else:
             self.log_message(f"Object {object_id} Not in Motor Bounds")
             self.ephemeris_cmd_location = None
@@ -325,8 +462,7 @@ class SmallRadioTelescopeDaemon:
         if self.rotor.angles_within_bounds(*new_rotor_cmd_location):
             self.rotor_destination = new_rotor_destination
             self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.wait_for_rotor()
         else:
             self.log_message(
                 f"Object at {new_rotor_cmd_location} Not in Motor Bounds")
@@ -346,14 +482,14 @@ class SmallRadioTelescopeDaemon:
         None
         """
         new_rotor_offsets = (az_off, el_off)
-        new_rotor_cmd_location = tuple(
-            map(add, self.rotor_destination, new_rotor_offsets)
+        new_rotor_cmd_location = (
+            self.rotor_destination[0] + az_off,
+            self.rotor_destination[1] + el_off,
         )
         if self.rotor.angles_within_bounds(*new_rotor_cmd_location):
             self.rotor_offsets = new_rotor_offsets
             self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.wait_for_rotor()
         else:
             self.log_message(f"Offset {new_rotor_offsets} Out of Bounds")
 
@@ -369,8 +505,7 @@ class SmallRadioTelescopeDaemon:
         self.rotor_offsets = (0.0, 0.0)
         self.rotor_destination = self.stow_location
         self.rotor_cmd_location = self.stow_location
-        while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-            sleep(0.1)
+        self.wait_for_rotor()
 
     def calibrate(self):
         """Runs Calibration Processing and Pushes New Values to Processing Script
@@ -389,10 +524,9 @@ class SmallRadioTelescopeDaemon:
         radio_cal_task.start()
         radio_cal_task.join(30)
         path = Path(self.config_directory, "calibration.json")
-        with open(path, "r") as input_file:
-            cal_data = json.load(input_file)
-            self.cal_values = cal_data["cal_values"]
-            self.cal_power = cal_data["cal_pwr"]
+        cal_data = json.loads(path.read_bytes())
+        self.cal_values = cal_data["cal_values"]
+        self.cal_power = cal_data["cal_pwr"]
         self.radio_queue.put(("cal_pwr", self.cal_power))
         self.radio_queue.put(("cal_values", self.cal_values))
         self.log_message("Calibration Done")
@@ -544,8 +678,7 @@ class SmallRadioTelescopeDaemon:
             self.ephemeris_cmd_location = name
             self.rotor_destination = new_rotor_cmd_location
             self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.wait_for_rotor()
         else:
             self.log_message(f"Object {name} Not in Motor Bounds")
             self.ephemeris_cmd_location = None
@@ -559,10 +692,23 @@ class SmallRadioTelescopeDaemon:
         -------
         None
         """
+        if self.ephemeris_tracker is None:
+            try:
+                self.ephemeris_tracker = EphemerisTracker(
+                    self.station["latitude"],
+                    self.station["longitude"],
+                    config_file=self.ephemeris_config_file,
+                )
+            except Exception as e:
+                # Hand the Failure to srt_daemon_main Rather Than Leaving it Waiting
+                self.ephemeris_error = e
+                self.ephemeris_ready.set()
+                return
         last_updated_time = None
+        last_tracker_time = None
         while True:
-            if last_updated_time is None or time() - last_updated_time > 10:
-                last_updated_time = time()
+            if last_updated_time is None or monotonic() - last_updated_time > 10:
+                last_updated_time = monotonic()
                 self.ephemeris_tracker.update_all_az_el()
             self.ephemeris_locations = (
                 self.ephemeris_tracker.get_all_azimuth_elevation()
@@ -571,13 +717,20 @@ class SmallRadioTelescopeDaemon:
             self.ephemeris_time_locs = (
                 self.ephemeris_tracker.get_all_azel_time()
             )
+            # Let the Status Publisher Know the Cached Locations Need Re-Serializing
+            # (Only After They Have Been Replaced, so the New Version is Never Stale)
+            if self.ephemeris_tracker.latest_time is not last_tracker_time:
+                last_tracker_time = self.ephemeris_tracker.latest_time
+                self.ephemeris_version += 1
+            self.ephemeris_ready.set()
             if self.ephemeris_cmd_location is not None:
                 new_rotor_destination = self.ephemeris_locations[
                     self.ephemeris_cmd_location
                 ]
                 self.current_vlsr = self.ephemeris_vlsr[self.ephemeris_cmd_location]
-                new_rotor_cmd_location = tuple(
-                    map(add, new_rotor_destination, self.rotor_offsets)
+                new_rotor_cmd_location = (
+                    new_rotor_destination[0] + self.rotor_offsets[0],
+                    new_rotor_destination[1] + self.rotor_offsets[1],
                 )
                 if self.rotor.angles_within_bounds(
                     *new_rotor_destination
@@ -591,6 +744,37 @@ class SmallRadioTelescopeDaemon:
                     self.ephemeris_cmd_location = None
             sleep(1)
 
+    def send_rotor_location(self):
+        """Pushes the Current Rotor Location to the GNU Radio Script
+
+        Motor azimuth and elevation are only queued when they have moved by more than
+        motor_update_threshold since the last value sent
+
+        Returns
+        -------
+        None
+        """
+        motor_az, motor_el = float(self.rotor_location[0]), float(self.rotor_location[1])
+        az_moved = (
+            self.last_sent_motor_az is None
+            or abs(motor_az - self.last_sent_motor_az) > self.motor_update_threshold
+        )
+        el_moved = (
+            self.last_sent_motor_el is None
+            or abs(motor_el - self.last_sent_motor_el) > self.motor_update_threshold
+        )
+        if not (az_moved or el_moved):
+            return
+        if az_moved:
+            self.radio_queue.put(("motor_az", motor_az))
+            self.last_sent_motor_az = motor_az
+        if el_moved:
+            self.radio_queue.put(("motor_el", motor_el))
+            self.last_sent_motor_el = motor_el
+        g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(self.rotor_location)
+        self.radio_queue.put(("glat", g_lat))
+        self.radio_queue.put(("glon", g_lon))
+
     def update_rotor_status(self):
         """Periodically Sets Rotor Azimuth and Elevation and Fetches New Antenna Position
 
@@ -609,44 +793,26 @@ class SmallRadioTelescopeDaemon:
                     self.rotor.set_azimuth_elevation(
                         *current_rotor_cmd_location)
                     sleep(1)
-                    start_time = time()
+                    start_time = monotonic()
                     while (
                         not azel_within_range(
                             self.rotor_location, current_rotor_cmd_location
                         )
-                    ) and (time() - start_time) < 10:
+                    ) and (monotonic() - start_time) < 10:
                         past_rotor_location = self.rotor_location
                         self.rotor_location = self.rotor.get_azimuth_elevation()
+                        self.rotor_location_event.set()
                         print(past_rotor_location, self.rotor_location)
                         if not self.rotor_location == past_rotor_location:
-                            g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(
-                                self.rotor_location
-                            )
-                            self.radio_queue.put(
-                                ("motor_az", float(self.rotor_location[0]))
-                            )
-                            self.radio_queue.put(
-                                ("motor_el", float(self.rotor_location[1]))
-                            )
-                            self.radio_queue.put(("glat", g_lat))
-                            self.radio_queue.put(("glon", g_lon))
+                            self.send_rotor_location()
                         sleep(0.5)
                 else:
                     past_rotor_location = self.rotor_location
                     self.rotor_location = self.rotor.get_azimuth_elevation()
+                    self.rotor_location_event.set()
                     print(self.rotor_location)
                     if not self.rotor_location == past_rotor_location:
-                        g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(
-                            self.rotor_location
-                        )
-                        self.radio_queue.put(
-                            ("motor_az", float(self.rotor_location[0]))
-                        )
-                        self.radio_queue.put(
-                            ("motor_el", float(self.rotor_location[1]))
-                        )
-                        self.radio_queue.put(("glat", g_lat))
-                        self.radio_queue.put(("glon", g_lon))
+                        self.send_rotor_location()
 
                     sleep(1)
             except AssertionError as e:
@@ -654,8 +820,16 @@ class SmallRadioTelescopeDaemon:
             except ValueError as e:
                 self.log_message(str(e))
 
-    def update_status(self):
-        """Periodically Publishes Daemon Status for Dashboard (or any other subscriber)
+    def update_messaging(self):
+        """Publishes Daemon Status and Receives New Commands Over ZMQ
+
+        Status is published every half second on the PUB socket for the Dashboard (or
+        any other subscriber), and between publishes the thread waits on the PULL
+        socket so that incoming commands are queued as soon as they arrive
+
+        Each status is published as three frames: the static values serialized once at
+        startup, the object locations re-serialized only when the ephemeris changes,
+        and the values which change over time
 
         Is Operated as an Infinite Looping Thread Function
 
@@ -663,41 +837,63 @@ class SmallRadioTelescopeDaemon:
         -------
         None
         """
-        context = zmq.Context()
+        context = zmq.Context.instance()
         status_port = 5555
         status_socket = context.socket(zmq.PUB)
         status_socket.bind("tcp://*:%s" % status_port)
+        command_port = 5556
+        command_socket = context.socket(zmq.PULL)
+        command_socket.bind("tcp://*:%s" % command_port)
+        poller = zmq.Poller()
+        poller.register(command_socket, zmq.POLLIN)
+        ephemeris_bytes = None
+        ephemeris_version = None
+        next_status_time = monotonic()
         while True:
+            poll_timeout = max(0.0, next_status_time - monotonic())
+            if poller.poll(timeout=poll_timeout * 1000):
+                try:
+                    while True:
+                        cmd = command_socket.recv_string(zmq.NOBLOCK)
+                        self.command_queue.put(cmd)
+                except zmq.Again:
+                    pass
+            if monotonic() < next_status_time:
+                continue
+            next_status_time = monotonic() + 0.5
+            if ephemeris_version != self.ephemeris_version:
+                ephemeris_version = self.ephemeris_version
+                ephemeris_bytes = json.dumps(
+                    {
+                        "object_locs": self.ephemeris_locations,
+                        "object_time_locs": self.ephemeris_time_locs,
+                    },
+                    separators=(",", ":"),
+                ).encode()
             status = {
-                "beam_width": self.beamwidth,
                 "location": self.station,
                 "motor_azel": self.rotor_location,
                 "motor_cmd_azel": self.rotor_cmd_location,
                 "vlsr": self.current_vlsr,
-                "object_locs": self.ephemeris_locations,
-                "object_time_locs": self.ephemeris_time_locs,
-                "az_limits": self.az_limits,
-                "el_limits": self.el_limits,
-                "stow_loc": self.stow_location,
-                "cal_loc": self.cal_location,
-                "horizon_points": self.horizon_points,
                 "center_frequency": self.radio_center_frequency,
                 "frequency_correction": self.radio_frequency_correction,
                 "bandwidth": self.radio_sample_frequency,
                 "motor_offsets": self.rotor_offsets,
                 "queued_item": self.current_queue_item,
                 "queue_size": self.command_queue.qsize(),
-                "emergency_contact": self.contact,
-                "error_logs": self.command_error_logs,
-                "temp_cal": self.temp_cal,
-                "temp_sys": self.temp_sys,
+                "error_logs": list(self.command_error_logs),
                 "cal_power": self.cal_power,
                 "n_point_data": self.n_point_data,
                 "beam_switch_data": self.beam_switch_data,
                 "time": time(),
             }
-            status_socket.send_json(status)
-            sleep(0.5)
+            status_socket.send_multipart(
+                [
+                    self.static_status_bytes,
+                    ephemeris_bytes,
+                    json.dumps(status, separators=(",", ":")).encode(),
+                ]
+            )
 
     def update_radio_settings(self):
         """Coordinates Sending XMLRPC Commands to the GNU Radio Script
@@ -709,28 +905,42 @@ class SmallRadioTelescopeDaemon:
         None
         """
         rpc_server = ServerProxy("http://localhost:5557/")
+        use_multicall = True
+        rpc_proxies = {}
         while True:
-            method, value = self.radio_queue.get()
-            call = getattr(rpc_server, f"set_{method}")
-            call(value)
-            sleep(0.1)
-
-    def update_command_queue(self):
-        """Waits for New Commands Coming in Over ZMQ PUSH/PULL
-
-        Is Operated as an Infinite Looping Thread Function
-
-        Returns
-        -------
-        None
-        """
-        context = zmq.Context()
-        command_port = 5556
-        command_socket = context.socket(zmq.PULL)
-        command_socket.bind("tcp://*:%s" % command_port)
-        while True:
-            cmd = command_socket.recv_string()
-            self.command_queue.put(cmd)
+            # Block for the Next Setting, then Drain Anything Else Already Queued
+            batch = [self.radio_queue.get()]
+            try:
+                while True:
+                    batch.append(self.radio_queue.get_nowait())
+            except Empty:
+                pass
+            if use_multicall:
+                # Send the Whole Batch as a Single system.multicall Request
+                multicall = MultiCall(rpc_server)
+                for method, value in batch:
+                    getattr(multicall, f"set_{method}")(value)
+                try:
+                    results = multicall()
+                except Fault as e:
+                    # Flowgraphs Without system.multicall Registered Reject the Request
+                    self.log_message(f"Radio Multicall Unsupported: {e.faultString}")
+                    use_multicall = False
+                else:
+                    for index, (method, _) in enumerate(batch):
+                        try:
+                            results[index]
+                        except Fault as e:
+                            self.log_message(f"Setting {method} Failed: {e.faultString}")
+            if not use_multicall:
+                for method, value in batch:
+                    call = rpc_proxies.get(method)
+                    if call is None:
+                        call = rpc_proxies[method] = getattr(rpc_server, f"set_{method}")
+                    try:
+                        call(value)
+                    except Fault as e:
+                        self.log_message(f"Setting {method} Failed: {e.faultString}")
 
     def srt_daemon_main(self):
         """Starts and Processes Commands for the SRT
@@ -746,11 +956,14 @@ class SmallRadioTelescopeDaemon:
         )
         rotor_pointing_thread = Thread(
             target=self.update_rotor_status, daemon=True)
-        command_queueing_thread = Thread(
-            target=self.update_command_queue, daemon=True)
-        status_thread = Thread(target=self.update_status, daemon=True)
+        messaging_thread = Thread(target=self.update_messaging, daemon=True)
         radio_thread = Thread(target=self.update_radio_settings, daemon=True)
 
+        # Start Loading Celestial Object Locations While the Radio Starts Up
+        # Status is Published Meanwhile, Using Any Cached Locations
+        ephemeris_tracker_thread.start()
+        messaging_thread.start()
+
         # If the GNU Radio Script Should be Running, Start It
         if self.radio_autostart:
             try:
@@ -760,6 +973,12 @@ class SmallRadioTelescopeDaemon:
             sleep(5)
 
         # Send Settings to the GNU Radio Script
+        self.ephemeris_ready.wait()
+        if self.ephemeris_error is not None:
+            self.log_message(f"Ephemeris Tracker Failed to Start: {self.ephemeris_error}")
+            raise self.ephemeris_error
+        g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(
+            self.rotor_location)
         radio_params = {
             "Frequency": (
                 "freq",
@@ -768,16 +987,8 @@ class SmallRadioTelescopeDaemon:
             "Sample Rate": ("samp_rate", self.radio_sample_frequency),
             "Motor Azimuth": ("motor_az", self.rotor_location[0]),
             "Motor Elevation": ("motor_el", self.rotor_location[1]),
-            "Motor GalLat": (
-                "glat",
-                self.ephemeris_tracker.convert_to_gal_coord(
-                    self.rotor_location)[0],
-            ),
-            "Motor GalLon": (
-                "glon",
-                self.ephemeris_tracker.convert_to_gal_coord(
-                    self.rotor_location)[1],
-            ),
+            "Motor GalLat": ("glat", g_lat),
+            "Motor GalLon": ("glon", g_lon),
             "Object Tracking": ("soutrack", "at_stow"),
             "System Temp": ("tsys", self.temp_sys),
             "Calibration Temp": ("tcal", self.temp_cal),
@@ -789,11 +1000,8 @@ class SmallRadioTelescopeDaemon:
             self.log_message(f"Setting {name}")
             self.radio_queue.put(radio_params[name])
 
-        # Start Infinite Looping Update Threads
-        ephemeris_tracker_thread.start()
+        # Start Remaining Infinite Looping Update Threads
         rotor_pointing_thread.start()
-        command_queueing_thread.start()
-        status_thread.start()
         radio_thread.start()
 
         while self.keep_running:
@@ -819,64 +1027,44 @@ class SmallRadioTelescopeDaemon:
                         self.beam_switch(object_id=command_parts[0])
                     else:  # Point Directly At Object
                         self.point_at_object(object_id=command_parts[0])
-                elif command_name == "stow":
-                    self.stow()
-                elif command_name == "cal":
-                    self.point_at_azel(*self.cal_location)
-                elif command_name == "calibrate":
-                    self.calibrate()
-                elif command_name == "quit":
-                    self.quit()
-                elif command_name == "record":
-                    self.start_recording(
-                        name=(None if len(command_parts)
-                              <= 1 else command_parts[1])
-                    )
-                elif command_name == "roff":
-                    self.stop_recording()
-                elif command_name == "freq":
-                    self.set_freq(frequency=float(
-                        command_parts[1]) * pow(10, 6))
-                elif command_name == "samp":
-                    self.set_samp_rate(samp_rate=float(
-                        command_parts[1]) * pow(10, 6))
-                elif command_name == "coords":
-                    self.set_coords(
-                        float(command_parts[1]), float(command_parts[2]))
+                elif command_name in self.command_handlers:
+                    self.command_handlers[command_name](command_parts)
                 elif command_name == "object":
                     if command_parts[-1] in self.ephemeris_locations:
                         self.find_object_location(command_parts[-1])
                 elif command_name == "obj_coords":
                     self.rotor_location = (
                         float(command_parts[1]), float(command_parts[2]))
-                elif command_name == "azel":
-                    self.point_at_azel(
-                        float(command_parts[1]),
-                        float(command_parts[2]),
-                    )
-                elif command_name == "offset":
-                    self.point_at_offset(
-                        float(command_parts[1]), float(command_parts[2])
-                    )
                 elif (
                     command_name.isnumeric()
                 ):  # If Command is a Number, Sleep that Long
                     sleep(float(command_name))
-                elif command_name == "wait":
-                    sleep(float(command_parts[1]))
                 # Wait Until Next Time H:M:S
                 elif command_name.split(":")[0] == "lst":
-                    time_string = command_name.replace("LST:", "")
-                    time_val = datetime.strptime(time_string, "%H:%M:%S")
-                    while time_val < datetime.utcfromtimestamp(time()):
+                    match = LST_WAIT_PATTERN.fullmatch(command_name)
+                    if match is None:
+                        raise ValueError(f"Invalid Time '{command_name}'")
+                    hour, minute, second = map(int, match.groups())
+                    current_time = datetime.utcfromtimestamp(time())
+                    time_val = current_time.replace(
+                        hour=hour, minute=minute, second=second, microsecond=0
+                    )
+                    if time_val < current_time:
                         time_val += timedelta(days=1)
                     time_delta = (
                         time_val - datetime.utcfromtimestamp(time())
                     ).total_seconds()
                     sleep(time_delta)
                 elif len(command_name.split(":")) == 5:  # Wait Until Y:D:H:M:S
-                    time_val = datetime.strptime(
-                        command_name, "%Y:%j:%H:%M:%S")
+                    match = DATE_WAIT_PATTERN.fullmatch(command_name)
+                    if match is None:
+                        raise ValueError(f"Invalid Time '{command_name}'")
+                    year, day, hour, minute, second = map(int, match.groups())
+                    if not 1 <= day <= (366 if calendar.isleap(year) else 365):
+                        raise ValueError(f"Invalid Day of Year '{day}'")
+                    time_val = datetime(year, 1, 1, hour, minute, second) + timedelta(
+                        days=day - 1
+                    )
                     time_delta = (
                         time_val - datetime.utcfromtimestamp(time())
                     ).total_seconds()
@@ -894,6 +1082,7 @@ class SmallRadioTelescopeDaemon:
         # On End, Return to Stow and End Recordings
         self.stop_recording()
         self.stow()
+        self.save_ephemeris_cache()
         if self.radio_autostart:
             sleep(1)
             self.radio_process_task.terminate()
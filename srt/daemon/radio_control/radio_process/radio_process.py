@@ -753,6 +753,14 @@ class radio_process(gr.top_block):
         )
 
 
+def snipfcn_snippet_0(self):
+    self.xmlrpc_server_0.register_multicall_functions()
+
+
+def snippets_main_after_init(tb):
+    snipfcn_snippet_0(tb)
+
+
 def argument_parser():
     parser = ArgumentParser()
     parser.add_argument(
@@ -778,6 +786,7 @@ def main(top_block_cls=radio_process, options=None):
     tb = top_block_cls(
         num_bins=options.num_bins, num_integrations=options.num_integrations
     )
+    snippets_main_after_init(tb)
 
     def sig_handler(sig=None, frame=None):
         tb.stop()
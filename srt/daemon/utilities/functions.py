@@ -43,11 +43,11 @@ def azel_within_range(actual_azel, desired_azel, bounds=(0.5, 0.5)):
     bool
         Whether Angles Were Within Threshold
     """
-    actual_az, actual_el = actual_azel
-    desired_az, desired_el = desired_azel
-    bounds_az, bounds_el = bounds
-    return angle_within_range(actual_az, desired_az, bounds_az) and angle_within_range(
-        actual_el, desired_el, bounds_el
+    # Comparisons are Inlined (Rather Than Calling angle_within_range) as This is
+    # Checked Every Time the Rotor Position Updates
+    return (
+        abs(actual_azel[0] - desired_azel[0]) < bounds[0]
+        and abs(actual_azel[1] - desired_azel[1]) < bounds[1]
     )
 
 
@@ -65,7 +65,7 @@ def get_spectrum(port=5561):
         Spectrum array as numpy array
 
     """
-    context = zmq.Context()
+    context = zmq.Context.instance()
     socket = context.socket(zmq.SUB)
     socket.connect("tcp://localhost:%s" % port)
     socket.subscribe("")
@@ -74,6 +74,8 @@ def get_spectrum(port=5561):
         var = np.frombuffer(rec, dtype="float32")
     except:
         return None
+    finally:
+        socket.close()
 
     return var
 
@@ -39,7 +39,7 @@ class CommandThread(Thread):
         -------
         None
         """
-        context = zmq.Context()
+        context = zmq.Context.instance()
         socket = context.socket(zmq.PUSH)
         socket.connect("tcp://localhost:%s" % self.port)
         while self.is_alive():
@@ -45,7 +45,7 @@ class RadioThread(Thread):
         -------
         None
         """
-        context = zmq.Context()
+        context = zmq.Context.instance()
         socket = context.socket(zmq.SUB)
         socket.connect("tcp://localhost:%s" % self.port)
         socket.subscribe("")
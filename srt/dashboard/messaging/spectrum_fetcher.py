@@ -47,7 +47,7 @@ class SpectrumThread(Thread):
         -------
         None
         """
-        context = zmq.Context()
+        context = zmq.Context.instance()
         socket = context.socket(zmq.SUB)
         socket.connect("tcp://localhost:%s" % self.port)
         socket.subscribe("")
@@ -40,13 +40,14 @@ class StatusThread(Thread):
         -------
 
         """
-        context = zmq.Context()
+        context = zmq.Context.instance()
         socket = context.socket(zmq.SUB)
         socket.connect("tcp://localhost:%s" % self.port)
         socket.subscribe("")
         while True:
-            rec = socket.recv()
-            dump = json.loads(rec)
+            dump = {}
+            for rec in socket.recv_multipart():
+                dump.update(json.loads(rec))
             self.status = dump
 
     def get_status(self):